@@ -3,11 +3,18 @@ This file should provide utilities for setting up test DBs and the like.  It's
 intended to be the containment zone for anything specific about the testing
 environment (e.g., the login info for the Postgres instance for testing)
 """
+import os
+
 import pytest
 from sqlalchemy import create_engine, text
 from config.settings import DATABASES
 
 TEST_DB = "mathesar_db_test"
+# When running in parallel with pytest-xdist, each worker has its own session,
+# and so creates and drops its own test DB.
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+if XDIST_WORKER is not None:
+    TEST_DB = f"{TEST_DB}_{XDIST_WORKER}"
 
 
 @pytest.fixture(scope="session")
@@ -435,7 +435,7 @@ def test_type_list_completeness(engine_with_types):
     assert type_set == actual_supported_db_types
 
 
-@pytest.mark.parametrize("target_type", type_set)
+@pytest.mark.parametrize("target_type", sorted(type_set))
 def test_create_column(engine_email_type, target_type):
     engine, schema = engine_email_type
     table_name = "atableone"
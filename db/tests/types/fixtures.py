@@ -7,6 +7,7 @@ those are imports that are used in these fixtures.
 """
 
 import pytest
+from sqlalchemy import inspect, text
 from sqlalchemy.schema import CreateSchema, DropSchema
 from db.engine import _add_custom_types_to_engine
 from db.types import base, install
@@ -14,7 +15,7 @@ from db.types import base, install
 TEST_SCHEMA = "test_schema"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def engine_with_types(engine):
     _add_custom_types_to_engine(engine)
     return engine
@@ -37,3 +38,66 @@ def engine_email_type(temporary_testing_schema):
     yield engine, schema
     with engine.begin() as conn:
         conn.execute(DropSchema(base.SCHEMA, cascade=True, if_exists=True))
+
+
+@pytest.fixture(scope="module")
+def engine_email_type_module(engine_with_types):
+    """
+    A module-scoped variant of engine_email_type.  Installing the Mathesar
+    types is the slow part of setting up the testing schema, so test modules
+    with many parametrized cases should use this (via clean_schema) to do it
+    only once.
+    """
+    engine, schema = engine_with_types, TEST_SCHEMA
+    with engine.begin() as conn:
+        conn.execute(CreateSchema(schema))
+    install.install_mathesar_on_database(engine)
+    yield engine, schema
+    with engine.begin() as conn:
+        conn.execute(DropSchema(schema, cascade=True, if_exists=True))
+        conn.execute(DropSchema(base.SCHEMA, cascade=True, if_exists=True))
+
+
+@pytest.fixture
+def clean_schema(engine_email_type_module):
+    """
+    Drops the tables a test created in the module-scoped testing schema,
+    while keeping the installed Mathesar types, and any tables which existed
+    before the test (e.g., module-scoped ones), around for the next test.
+    """
+    engine, schema = engine_email_type_module
+    existing_tables = set(inspect(engine).get_table_names(schema=schema))
+    yield engine, schema
+    created_tables = set(inspect(engine).get_table_names(schema=schema)) - existing_tables
+    preparer = engine.dialect.identifier_preparer
+    with engine.begin() as conn:
+        for table_name in created_tables:
+            conn.execute(text(
+                f"DROP TABLE IF EXISTS {preparer.quote_schema(schema)}.{preparer.quote(table_name)} CASCADE"
+            ))
+
+
+@pytest.fixture(scope="module")
+def module_connection(engine_email_type_module):
+    engine, _ = engine_email_type_module
+    with engine.connect() as conn:
+        trans = conn.begin()
+        yield conn
+        trans.rollback()
+
+
+@pytest.fixture
+def savepoint_connection(module_connection):
+    """
+    Yields the module-scoped connection with a savepoint set; everything the
+    test does on the connection is rolled back afterwards.  Note that changes
+    made in the savepoint are invisible to other connections, so any tables
+    the test alters must already be committed, e.g., by creating them using
+    the engine.  Such committed, module-scoped tables are invalidated by
+    any function-scoped fixture that resets the whole schema, which is why
+    clean_schema only drops the tables created during its test.
+    """
+    savepoint = module_connection.begin_nested()
+    yield module_connection
+    if savepoint.is_active:
+        savepoint.rollback()
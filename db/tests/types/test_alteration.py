@@ -1,9 +1,10 @@
 from datetime import timedelta, date
 from decimal import Decimal
+from functools import lru_cache
 
 import pytest
 from psycopg2.errors import InvalidParameterValue
-from sqlalchemy import Table, Column, MetaData
+from sqlalchemy import Table, Column, MetaData, column, select, text
 from sqlalchemy import String, Numeric
 from sqlalchemy.exc import DataError
 from db import types, columns, tables
@@ -16,8 +17,54 @@ from db.types.base import PostgresType, MathesarCustomType, get_qualified_name,
 # properly detect the fixtures.  Importing them directly results in a
 # flake8 unused import error, and a bunch of flake8 F811 errors.
 engine_with_types = fixtures.engine_with_types
-engine_email_type = fixtures.engine_email_type
-temporary_testing_schema = fixtures.temporary_testing_schema
+engine_email_type_module = fixtures.engine_email_type_module
+clean_schema = fixtures.clean_schema
+module_connection = fixtures.module_connection
+savepoint_connection = fixtures.savepoint_connection
+
+
+@pytest.fixture(scope="module")
+def available_types(engine_email_type_module):
+    engine, _ = engine_email_type_module
+    return get_available_types(engine)
+
+
+@pytest.fixture(scope="session")
+def full_cast_map(engine_with_types):
+    return alteration.get_full_cast_map(engine_with_types)
+
+
+@pytest.fixture(scope="module")
+def reusable_table(engine_email_type_module, available_types):
+    """
+    Returns a function which gives an empty single column table of the given
+    type.  Tests using it must leave the table empty and unaltered, e.g., by
+    making their changes through savepoint_connection.  The underlying table
+    is only recreated when the requested type differs from that of the
+    previous call, so grouped parametrizations share one table.  The cached
+    table is created again if something else dropped it in the meantime.
+    """
+    engine, schema = engine_email_type_module
+    metadata = MetaData(bind=engine)
+    current = {}
+
+    def _get_reusable_table(type_):
+        if current.get("type") != type_:
+            metadata.clear()
+            table = Table(
+                REUSABLE_TABLE_NAME,
+                metadata,
+                Column(COLUMN_NAME, available_types[type_]),
+                schema=schema
+            )
+            table.drop(checkfirst=True)
+            table.create()
+            current.update(type=type_, table=table)
+        else:
+            current["table"].create(checkfirst=True)
+        return current["table"]
+
+    return _get_reusable_table
 
 
 BIGINT = PostgresType.BIGINT.value.upper()
@@ -42,6 +89,26 @@ SUPPORTED_MAP_NAME = "supported_map_name"
 VALID = "valid"
 INVALID = "invalid"
 
+TABLE_NAME = "testtable"
+REUSABLE_TABLE_NAME = "reusabletesttable"
+COLUMN_NAME = "testcol"
+
+
+# The integer types share their casting targets and values.  BIGINT only adds
+# a value too large for the other integer types.
+_INT_TARGET_DICT = {
+    BIGINT: {VALID: [(500, 500)]},
+    BOOLEAN: {VALID: [(1, True), (0, False)], INVALID: [3]},
+    DECIMAL: {VALID: [(1, Decimal('1.0'))]},
+    DOUBLE: {VALID: [(3, 3.0)]},
+    FLOAT: {VALID: [(4, 4.0)]},
+    INTEGER: {VALID: [(500, 500)]},
+    NUMERIC: {VALID: [(1, Decimal('1.0'))]},
+    REAL: {VALID: [(5, 5.0)]},
+    SMALLINT: {VALID: [(500, 500)]},
+    VARCHAR: {VALID: [(3, "3")]},
+}
+
 
 MASTER_DB_TYPE_MAP_SPEC = {
     # This dict specifies the full map of what types can be cast to what
@@ -70,17 +137,8 @@ MASTER_DB_TYPE_MAP_SPEC = {
     BIGINT: {
         ISCHEMA_NAME: PostgresType.BIGINT.value,
         REFLECTED_NAME: BIGINT,
-        TARGET_DICT: {
+        TARGET_DICT: _INT_TARGET_DICT | {
             BIGINT: {VALID: [(500, 500), (500000000000, 500000000000)]},
-            BOOLEAN: {VALID: [(1, True), (0, False)], INVALID: [3]},
-            DECIMAL: {VALID: [(1, Decimal('1.0'))]},
-            DOUBLE: {VALID: [(3, 3.0)]},
-            FLOAT: {VALID: [(4, 4.0)]},
-            INTEGER: {VALID: [(500, 500)]},
-            NUMERIC: {VALID: [(1, Decimal('1.0'))]},
-            REAL: {VALID: [(5, 5.0)]},
-            SMALLINT: {VALID: [(500, 500)]},
-            VARCHAR: {VALID: [(3, "3")]},
         }
     },
     BOOLEAN: {
@@ -168,18 +226,7 @@ MASTER_DB_TYPE_MAP_SPEC = {
     INTEGER: {
         ISCHEMA_NAME: PostgresType.INTEGER.value,
         REFLECTED_NAME: INTEGER,
-        TARGET_DICT: {
-            BIGINT: {VALID: [(500, 500)]},
-            BOOLEAN: {VALID: [(1, True), (0, False)], INVALID: [3]},
-            DECIMAL: {VALID: [(1, Decimal('1.0'))]},
-            DOUBLE: {VALID: [(3, 3.0)]},
-            FLOAT: {VALID: [(4, 4.0)]},
-            INTEGER: {VALID: [(500, 500)]},
-            NUMERIC: {VALID: [(1, Decimal('1.0'))]},
-            REAL: {VALID: [(5, 5.0)]},
-            SMALLINT: {VALID: [(500, 500)]},
-            VARCHAR: {VALID: [(3, "3")]},
-        }
+        TARGET_DICT: _INT_TARGET_DICT,
     },
     INTERVAL: {
         ISCHEMA_NAME: PostgresType.INTERVAL.value,
@@ -256,18 +303,7 @@ MASTER_DB_TYPE_MAP_SPEC = {
     SMALLINT: {
         ISCHEMA_NAME: PostgresType.SMALLINT.value,
         REFLECTED_NAME: SMALLINT,
-        TARGET_DICT: {
-            BIGINT: {VALID: [(500, 500)]},
-            BOOLEAN: {VALID: [(1, True), (0, False)], INVALID: [3]},
-            DECIMAL: {VALID: [(1, Decimal('1.0'))]},
-            DOUBLE: {VALID: [(3, 3.0)]},
-            FLOAT: {VALID: [(4, 4.0)]},
-            INTEGER: {VALID: [(500, 500)]},
-            NUMERIC: {VALID: [(1, Decimal('1.0'))]},
-            REAL: {VALID: [(5, 5.0)]},
-            SMALLINT: {VALID: [(500, 500)]},
-            VARCHAR: {VALID: [(3, "3")]},
-        }
+        TARGET_DICT: _INT_TARGET_DICT,
     },
     DATE: {
         ISCHEMA_NAME: PostgresType.DATE.value,
@@ -365,85 +401,107 @@ def test_get_alter_column_types_with_custom_engine(engine_with_types):
     )
 
 
+@lru_cache(maxsize=None)
+def _compile_type(type_class, dialect):
+    return type_class().compile(dialect=dialect)
+
+
 def test_get_alter_column_types_with_unfriendly_names(engine_with_types):
     type_dict = alteration.get_supported_alter_column_types(
         engine_with_types, friendly_names=False
     )
     assert all(
-        [
-            type_dict[type_]().compile(dialect=engine_with_types.dialect) == type_
-            for type_ in type_dict
-        ]
+        _compile_type(type_dict[type_], engine_with_types.dialect) == type_
+        for type_ in type_dict
     )
 
 
-type_test_list = [
-    (
-        val[ISCHEMA_NAME],
-        MASTER_DB_TYPE_MAP_SPEC[target].get(
-            SUPPORTED_MAP_NAME, MASTER_DB_TYPE_MAP_SPEC[target][ISCHEMA_NAME]
-        ),
-        {},
-        MASTER_DB_TYPE_MAP_SPEC[target][REFLECTED_NAME]
+# The parameter lists for the generated alteration tests below are all
+# built in a single pass over MASTER_DB_TYPE_MAP_SPEC.  Cases sharing a
+# source type stay adjacent, so they can share a reusable_table.
+_SUPPORTED_NAME = {
+    key: val.get(SUPPORTED_MAP_NAME, val[ISCHEMA_NAME])
+    for key, val in MASTER_DB_TYPE_MAP_SPEC.items()
+}
+_REFLECTED = {key: val[REFLECTED_NAME] for key, val in MASTER_DB_TYPE_MAP_SPEC.items()}
+type_test_list = []
+type_test_data_gen_list = []
+type_test_bad_data_gen_map = {}
+for val in MASTER_DB_TYPE_MAP_SPEC.values():
+    source_type = val[ISCHEMA_NAME]
+    for target, target_dict in val[TARGET_DICT].items():
+        target_type = _SUPPORTED_NAME[target]
+        type_test_list.append((source_type, target_type, {}, _REFLECTED[target]))
+        if target in [NUMERIC, DECIMAL]:
+            type_test_list += [
+                (source_type, target_type, {"precision": 5}, "NUMERIC(5, 0)"),
+                (source_type, target_type, {"precision": 5, "scale": 3}, "NUMERIC(5, 3)"),
+            ]
+        type_test_data_gen_list += [
+            (source_type, target_type, in_val, out_val)
+            for in_val, out_val in target_dict.get(VALID, [])
+        ]
+        if INVALID in target_dict:
+            type_test_bad_data_gen_map.setdefault(source_type, []).extend(
+                (target_type, data) for data in target_dict[INVALID]
+            )
+
+
+def _reflect_col_type(conn, available_types, schema, table_name, column_name):
+    """
+    Returns the compiled type of a single column, looked up from
+    information_schema rather than by reflecting the whole table.
+    """
+    sel = text(
+        """
+        SELECT data_type, domain_schema, domain_name, numeric_precision, numeric_scale
+        FROM information_schema.columns
+        WHERE table_schema = :schema
+          AND table_name = :table_name
+          AND column_name = :column_name
+        """
     )
-    for val in MASTER_DB_TYPE_MAP_SPEC.values()
-    for target in val[TARGET_DICT]
-] + [
-    (val[ISCHEMA_NAME], "numeric", {"precision": 5}, "NUMERIC(5, 0)")
-    for val in MASTER_DB_TYPE_MAP_SPEC.values() if NUMERIC in val[TARGET_DICT]
-] + [
-    (val[ISCHEMA_NAME], "numeric", {"precision": 5, "scale": 3}, "NUMERIC(5, 3)")
-    for val in MASTER_DB_TYPE_MAP_SPEC.values() if NUMERIC in val[TARGET_DICT]
-] + [
-    (val[ISCHEMA_NAME], "decimal", {"precision": 5}, "NUMERIC(5, 0)")
-    for val in MASTER_DB_TYPE_MAP_SPEC.values() if DECIMAL in val[TARGET_DICT]
-] + [
-    (val[ISCHEMA_NAME], "decimal", {"precision": 5, "scale": 3}, "NUMERIC(5, 3)")
-    for val in MASTER_DB_TYPE_MAP_SPEC.values() if DECIMAL in val[TARGET_DICT]
-]
+    data_type, domain_schema, domain_name, precision, scale = conn.execute(
+        sel, {"schema": schema, "table_name": table_name, "column_name": column_name}
+    ).first()
+    if domain_name is not None:
+        data_type = f"{domain_schema}.{domain_name}"
+    type_class = available_types[data_type]
+    # Only numeric takes its precision and scale as type options; the other
+    # numeric types report their fixed (binary) precision here.
+    if data_type == PostgresType.NUMERIC.value and precision is not None:
+        type_ = type_class(precision, scale)
+    else:
+        type_ = type_class()
+    return type_.compile(dialect=conn.dialect)
 
 
 @pytest.mark.parametrize(
     "type_,target_type,options,expect_type", type_test_list
 )
 def test_alter_column_type_alters_column_type(
-        engine_email_type, type_, target_type, options, expect_type
+        engine_email_type_module, reusable_table, savepoint_connection,
+        available_types, type_, target_type, options, expect_type
 ):
     """
     The massive number of cases make sure all type casting functions at
     least pass a smoke test for each type mapping defined in
     MASTER_DB_TYPE_MAP_SPEC above.
     """
-    engine, schema = engine_email_type
-    available_types = get_available_types(engine)
-    TABLE_NAME = "testtable"
-    COLUMN_NAME = "testcol"
-    metadata = MetaData(bind=engine)
-    input_table = Table(
-        TABLE_NAME,
-        metadata,
-        Column(COLUMN_NAME, available_types[type_]),
-        schema=schema
+    engine, schema = engine_email_type_module
+    conn = savepoint_connection
+    input_table = reusable_table(type_)
+    alteration.alter_column_type(
+        input_table,
+        COLUMN_NAME,
+        engine,
+        conn,
+        target_type,
+        options
+    )
+    actual_type = _reflect_col_type(
+        conn, available_types, schema, input_table.name, COLUMN_NAME
     )
-    input_table.create()
-    with engine.begin() as conn:
-        alteration.alter_column_type(
-            input_table,
-            COLUMN_NAME,
-            engine,
-            conn,
-            target_type,
-            options
-        )
-    metadata = MetaData(bind=engine)
-    metadata.reflect()
-    actual_column = Table(
-        TABLE_NAME,
-        metadata,
-        schema=schema,
-        autoload_with=engine
-    ).columns[COLUMN_NAME]
-    actual_type = actual_column.type.compile(dialect=engine.dialect)
     assert actual_type == expect_type
 
 
@@ -461,11 +519,9 @@ type_test_data_args_list = [
     "type_,target_type,options,value,expect_value", type_test_data_args_list
 )
 def test_alter_column_type_casts_column_data_args(
-        engine_email_type, type_, target_type, options, value, expect_value,
+        clean_schema, type_, target_type, options, value, expect_value,
 ):
-    engine, schema = engine_email_type
-    TABLE_NAME = "testtable"
-    COLUMN_NAME = "testcol"
+    engine, schema = clean_schema
     metadata = MetaData(bind=engine)
     input_table = Table(
         TABLE_NAME,
@@ -485,8 +541,7 @@ def test_alter_column_type_casts_column_data_args(
             target_type,
             options
         )
-    metadata = MetaData(bind=engine)
-    metadata.reflect()
+    metadata.clear()
     actual_table = Table(
         TABLE_NAME,
         metadata,
@@ -500,113 +555,102 @@ def test_alter_column_type_casts_column_data_args(
     assert actual_value == expect_value
 
 
-type_test_data_gen_list = [
-    (
-        val[ISCHEMA_NAME],
-        MASTER_DB_TYPE_MAP_SPEC[target].get(
-            SUPPORTED_MAP_NAME, MASTER_DB_TYPE_MAP_SPEC[target][ISCHEMA_NAME]
-        ),
-        in_val,
-        out_val,
+def _fetch_default(conn, schema, table_name, column_name):
+    """
+    Returns the python value of a column's default.  This finds the default
+    expression with one catalog query, in place of looking up the table OID
+    and reflecting the table as columns.get_column_default does.
+    """
+    sel = text(
+        """
+        SELECT pg_get_expr(d.adbin, d.adrelid)
+        FROM pg_attrdef d
+        JOIN pg_attribute a ON a.attrelid = d.adrelid AND a.attnum = d.adnum
+        WHERE a.attrelid = CAST(:qualified_name AS regclass)
+          AND a.attname = :column_name
+        """
     )
-    for val in MASTER_DB_TYPE_MAP_SPEC.values()
-    for target in val[TARGET_DICT]
-    for in_val, out_val in val[TARGET_DICT][target].get(VALID, [])
-]
+    default_textual_sql = conn.execute(
+        sel, {"qualified_name": f"{schema}.{table_name}", "column_name": column_name}
+    ).first()[0]
+    # As in columns.get_column_default, we execute the stored expression,
+    # e.g., "'500'::bigint", to get the proper python value.
+    return conn.execute(text(f"SELECT {default_textual_sql}")).first()[0]
 
 
 @pytest.mark.parametrize(
     "source_type,target_type,in_val,out_val", type_test_data_gen_list
 )
 def test_alter_column_casts_data_gen(
-        engine_email_type, source_type, target_type, in_val, out_val
+        engine_email_type_module, reusable_table, savepoint_connection,
+        source_type, target_type, in_val, out_val
 ):
-    engine, schema = engine_email_type
-    available_types = get_available_types(engine)
-    TABLE_NAME = "testtable"
-    COLUMN_NAME = "testcol"
-    metadata = MetaData(bind=engine)
-    input_table = Table(
-        TABLE_NAME,
-        metadata,
-        Column(COLUMN_NAME, available_types[source_type], server_default=str(in_val)),
-        schema=schema
-    )
-    input_table.create()
+    engine, schema = engine_email_type_module
+    conn = savepoint_connection
+    input_table = reusable_table(source_type)
+    columns.set_column_default(input_table, 0, engine, conn, str(in_val))
     ins = input_table.insert(values=(in_val,))
-    with engine.begin() as conn:
-        conn.execute(ins)
-        alteration.alter_column_type(
-            input_table,
-            COLUMN_NAME,
-            engine,
-            conn,
-            target_type
-        )
-    metadata = MetaData(bind=engine)
-    metadata.reflect()
-    actual_table = Table(TABLE_NAME, metadata, schema=schema, autoload_with=engine)
-    sel = actual_table.select()
-    with engine.connect() as conn:
-        res = conn.execute(sel).fetchall()
+    conn.execute(ins)
+    alteration.alter_column_type(
+        input_table,
+        COLUMN_NAME,
+        engine,
+        conn,
+        target_type
+    )
+    # The column is selected untyped, since input_table still carries the
+    # source type, whose result processing would mangle the cast values.
+    sel = select(column(COLUMN_NAME)).select_from(input_table)
+    res = conn.execute(sel).fetchall()
+    assert len(res) == 1
     actual_value = res[0][0]
     assert actual_value == out_val
-    table_oid = tables.get_oid_from_table(TABLE_NAME, schema, engine)
-    actual_default = columns.get_column_default(table_oid, 0, engine)
+    actual_default = _fetch_default(conn, schema, input_table.name, COLUMN_NAME)
     assert actual_default == out_val
 
 
-type_test_bad_data_gen_list = [
-    (
-        val[ISCHEMA_NAME],
-        MASTER_DB_TYPE_MAP_SPEC[target].get(
-            SUPPORTED_MAP_NAME, MASTER_DB_TYPE_MAP_SPEC[target][ISCHEMA_NAME]
-        ),
-        data,
-    )
-    for val in MASTER_DB_TYPE_MAP_SPEC.values()
-    for target in val[TARGET_DICT]
-    for data in val[TARGET_DICT][target].get(INVALID, [])
-]
-
-
 @pytest.mark.parametrize(
-    "type_,target_type,value", type_test_bad_data_gen_list
+    "type_,target_value_list", type_test_bad_data_gen_map.items()
 )
 def test_alter_column_type_raises_on_bad_column_data(
-        engine_email_type, type_, target_type, value,
+        engine_email_type_module, reusable_table, savepoint_connection,
+        type_, target_value_list,
 ):
-    engine, schema = engine_email_type
-    available_types = get_available_types(engine)
-    TABLE_NAME = "testtable"
-    COLUMN_NAME = "testcol"
-    metadata = MetaData(bind=engine)
-    input_table = Table(
-        TABLE_NAME,
-        metadata,
-        Column(COLUMN_NAME, available_types[type_]),
-        schema=schema
-    )
-    input_table.create()
-    ins = input_table.insert(values=(value,))
-    with engine.begin() as conn:
-        conn.execute(ins)
-        with pytest.raises(Exception):
-            alteration.alter_column_type(
-                input_table,
-                COLUMN_NAME,
-                engine,
-                conn,
-                target_type
-            )
+    """
+    The cases for each source type are checked on one table, each within its
+    own savepoint, since every failed alteration must be rolled back.  All
+    cases are checked before failing, so the report lists every cast that
+    wrongly accepted its bad value.
+    """
+    engine, schema = engine_email_type_module
+    conn = savepoint_connection
+    input_table = reusable_table(type_)
+    accepted = []
+    for target_type, value in target_value_list:
+        savepoint = conn.begin_nested()
+        try:
+            ins = input_table.insert(values=(value,))
+            conn.execute(ins)
+            try:
+                alteration.alter_column_type(
+                    input_table,
+                    COLUMN_NAME,
+                    engine,
+                    conn,
+                    target_type
+                )
+            except Exception:
+                continue
+            accepted.append(f"{type_} -> {target_type} accepted {value!r}")
+        finally:
+            savepoint.rollback()
+    assert accepted == []
 
 
 def test_alter_column_type_raises_on_bad_parameters(
-        engine_email_type,
+        clean_schema,
 ):
-    engine, schema = engine_email_type
-    TABLE_NAME = "testtable"
-    COLUMN_NAME = "testcol"
+    engine, schema = clean_schema
     metadata = MetaData(bind=engine)
     input_table = Table(
         TABLE_NAME,
@@ -701,20 +745,19 @@ expect_cast_tuples = [
 
 
 @pytest.mark.parametrize("source_type,expect_target_types", expect_cast_tuples)
-def test_get_full_cast_map(engine_with_types, source_type, expect_target_types):
-    actual_cast_map = alteration.get_full_cast_map(engine_with_types)
-    actual_target_types = actual_cast_map[source_type]
+def test_get_full_cast_map(full_cast_map, source_type, expect_target_types):
+    actual_target_types = full_cast_map[source_type]
     assert len(actual_target_types) == len(expect_target_types)
     assert sorted(actual_target_types) == sorted(expect_target_types)
 
 
-def test_get_column_cast_records(engine_email_type):
+def test_get_column_cast_records(clean_schema):
     COL1 = "col1"
     COL2 = "col2"
     col1 = Column(COL1, String)
     col2 = Column(COL2, String)
     column_list = [col1, col2]
-    engine, schema = engine_email_type
+    engine, schema = clean_schema
     table_name = "table_with_columns"
     table = tables.create_mathesar_table(
         table_name, schema, column_list, engine
@@ -739,13 +782,13 @@ def test_get_column_cast_records(engine_email_type):
         )
 
 
-def test_get_column_cast_records_options(engine_email_type):
+def test_get_column_cast_records_options(clean_schema):
     COL1 = "col1"
     COL2 = "col2"
     col1 = Column(COL1, String)
     col2 = Column(COL2, String)
     column_list = [col1, col2]
-    engine, schema = engine_email_type
+    engine, schema = clean_schema
     table_name = "table_with_columns"
     table = tables.create_mathesar_table(
         table_name, schema, column_list, engine